@@ -8,7 +8,10 @@ It features:
 - Lossy compression and Fast Load Data embedding.
 - Automatic fallback: Copies original RAW file if conversion fails.
 - Anti-collision naming: Auto-renames files to avoid overwriting.
-- localized logging: Saves logs inside the destination folder.
+- localized logging: Saves logs inside the destination folder, plus a CSV with the outcome of every file.
+- Batched conversion: Hands several files to each Adobe DNG Converter run (--batch-size).
+- Parallel conversion: Runs several Adobe DNG Converter processes at once (--jobs),
+  and can process several folders at once (--folder-jobs).
 
 Author: [Filipe Rivelli]
 License: MIT
@@ -18,59 +21,239 @@ import os
 import sys
 import subprocess
 import platform
+import re
 import logging
+import logging.handlers
 import shutil
+import threading
+import signal
+import itertools
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 import argparse
-from typing import List, Tuple, Optional
+import csv
+import tempfile
+from typing import Dict, Iterator, List, Set, Tuple, Optional
+
+# Optional dependency: io_uring based copies on Linux (pip install liburing)
+try:
+    import liburing
+except ImportError:
+    liburing = None
 
 # --- Configuration Constants ---
 # Supported RAW extensions (case-insensitive)
-SUPPORTED_EXTENSIONS = {'.cr2', '.cr3'}
+SUPPORTED_EXTENSIONS = ('.cr2', '.cr3')
+
+# Every upper/lower case spelling of the extensions ('.cr2', '.CR2', '.Cr2', ...),
+# so file names can be matched with str.endswith() without lowercasing them
+SUPPORTED_SUFFIXES = tuple(sorted({
+    ''.join(chars)
+    for ext in SUPPORTED_EXTENSIONS
+    for chars in itertools.product(*({c.lower(), c.upper()} for c in ext))
+}))
 
 # Adobe DNG Converter arguments
 # -lossy: Enable lossy compression (smaller file size)
 # -fl: Embed Fast Load data for Lightroom performance
 ADOBE_ARGS = ["-lossy", "-fl"]
 
+# Adobe stderr lines worth logging: non-blank and not one of the irrelevant GPU warnings
+GPU_RE = re.compile(rb'^(?!.*GPU).*\S.*$', re.M)
+
 # Name of the output folder and log file
 OUTPUT_DIR_NAME = "DNG"
 LOG_FILENAME = "conversion_log.txt"
+RESULTS_FILENAME = "conversion_log.csv"
+
+# Default number of parallel Adobe DNG Converter processes per folder.
+# Conversion is mixed CPU + disk I/O, so going far beyond the core count hurts.
+DEFAULT_JOBS = min(os.cpu_count() or 1, 8)
+
+# Block size for the zero-copy fallback copy (bigger than shutil's 64 KiB default)
+COPY_BLOCK_SIZE = 4 * 1024 * 1024
+
+# Number of blocks an io_uring copy keeps in flight
+URING_QUEUE_DEPTH = 4
+
+# Default number of RAW files handed to a single Adobe DNG Converter run.
+# Batching amortizes Adobe's startup cost over several files.
+DEFAULT_BATCH_SIZE = 32
+
+# Upper bound for a single run, and for the input paths on its command line
+# (Windows rejects command lines longer than 32767 characters)
+MAX_BATCH_SIZE = 256
+MAX_INPUT_CHARS = 30000
+
+# Inputs read ahead of the one being converted, and how often (seconds) a run is checked for progress
+PREFETCH_AHEAD = 2
+PREFETCH_POLL_INTERVAL = 0.5
+
+# Guards output name reservation across conversion threads
+_name_lock = threading.Lock()
+
+# Adobe DNG Converter path resolved by the parent process, set in each pool worker by _init_worker()
+_worker_adobe_exe = None
+
+# Background reader warming the OS cache where posix_fadvise is unavailable (Windows, macOS)
+_prefetch_executor = None
+_prefetch_lock = threading.Lock()
+
+# Guards the one-time setup of _direct_logger()
+_log_setup_lock = threading.Lock()
+
+# One io_uring copy engine per conversion thread
+_uring_local = threading.local()
+_uring_available = liburing is not None
+
+class CachedTimeFormatter(logging.Formatter):
+    """
+    Formatter that runs localtime/strftime once per second instead of once per record.
+    Only valid for date formats without sub-second fields.
+    """
+
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None):
+        super().__init__(fmt, datefmt)
+        # (second, formatted text), swapped as a whole so threads never see a torn update
+        self._cache = (None, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        second = int(record.created)
+        cached_second, text = self._cache
+        if second != cached_second:
+            text = super().formatTime(record, datefmt)
+            self._cache = (second, text)
+        return text
+
+# Format: Date Time - Level - Message
+LOG_FORMATTER = CachedTimeFormatter(
+    '%(asctime)s - %(levelname)s - %(message)s', 
+    datefmt='%Y-%m-%d %H:%M:%S'
+)
+
+class FolderLogger(logging.LoggerAdapter):
+    """
+    Logger for one folder: tags every record with the destination folder ('dest'),
+    which the parent's FolderFileHandler uses to pick the log file.
+    """
+
+    def process(self, msg, kwargs):
+        kwargs["extra"] = {**self.extra, **kwargs.get("extra", {})}
+        return msg, kwargs
+
+class FolderFileHandler(logging.Handler):
+    """
+    Parent-side handler routing records to the log file of their destination folder.
+    A log file stays open until close_logger() sends its 'close_log' record.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._handlers: Dict[str, Optional[logging.FileHandler]] = {}
+
+    def emit(self, record: logging.LogRecord) -> None:
+        dest = getattr(record, "dest", None)
+        if dest is None:
+            return
+
+        if getattr(record, "close_log", False):
+            handler = self._handlers.pop(dest, None)
+            if handler is not None:
+                handler.close()
+            return
+
+        if dest not in self._handlers:
+            try:
+                # Appends: setup_logger() already created (truncated) the file in the worker
+                handler = logging.FileHandler(Path(dest) / LOG_FILENAME, encoding='utf-8', mode='a')
+                handler.setFormatter(self.formatter)
+            except Exception as e:
+                print(f"CRITICAL ERROR: Could not open log file in {dest}: {e}", flush=True)
+                handler = None
+            self._handlers[dest] = handler
+
+        handler = self._handlers[dest]
+        if handler is not None:
+            handler.emit(record)
+
+    def close(self) -> None:
+        for handler in self._handlers.values():
+            if handler is not None:
+                handler.close()
+        self._handlers.clear()
+        super().close()
+
+def _skip_close_records(record: logging.LogRecord) -> bool:
+    return not getattr(record, "close_log", False)
+
+def _make_log_handlers() -> List[logging.Handler]:
+    """
+    Returns the handlers writing folder records: to the log file of their folder, and to the console.
+    """
+    file_handler = FolderFileHandler()
+    file_handler.setFormatter(LOG_FORMATTER)
 
-def setup_logger(dest_folder: Path) -> bool:
+    # Console Handler (Prints to screen)
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(LOG_FORMATTER)
+    console_handler.addFilter(_skip_close_records)
+
+    return [file_handler, console_handler]
+
+def start_log_listener(log_queue: multiprocessing.Queue) -> logging.handlers.QueueListener:
+    """
+    Starts the single listener (in the parent) that writes the records of every pool worker.
+    """
+    listener = logging.handlers.QueueListener(log_queue, *_make_log_handlers())
+    listener.start()
+    return listener
+
+def _direct_logger() -> logging.Logger:
+    """
+    Logger writing the folder records itself, for process_single_folder() called outside
+    the pool, where no QueueHandler forwards them to the parent's listener.
+    """
+    logger = logging.getLogger(f"{__name__}.direct")
+    with _log_setup_lock:
+        if not logger.handlers:
+            for handler in _make_log_handlers():
+                logger.addHandler(handler)
+            logger.setLevel(logging.INFO)
+            logger.propagate = False
+    return logger
+
+def _process_logger() -> logging.Logger:
     """
-    Configures the logging system to write to a file INSIDE the destination folder.
+    Returns the logger of this process. Records logged without a folder ('dest') only go to
+    the console, in order with the folder records, since they take the same path.
+    """
+    if any(isinstance(h, logging.handlers.QueueHandler) for h in logging.getLogger().handlers):
+        return logging.getLogger(__name__)
+    return _direct_logger()
+
+def setup_logger(dest_folder: Path) -> Optional[FolderLogger]:
+    """
+    Returns the logger of one folder. Its records go through the worker's QueueHandler
+    (see _init_worker) to the parent, which writes them INSIDE the destination folder.
+    Without a QueueHandler (called outside the pool), this process writes them itself.
+    Creates the log file up front, so a folder that can't be logged is skipped.
     """
     log_file_path = dest_folder / LOG_FILENAME
-    
-    logger = logging.getLogger()
-    logger.setLevel(logging.INFO)
-    
-    # Clear previous handlers to avoid mixing logs between different folders
-    if logger.hasHandlers():
-        logger.handlers.clear()
-
-    # Format: Date Time - Level - Message
-    formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(message)s', 
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
 
     try:
-        # File Handler (Writes to the DNG folder)
-        file_handler = logging.FileHandler(log_file_path, encoding='utf-8', mode='w')
-        file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        log_file_path.open('w', encoding='utf-8').close()
     except Exception as e:
-        print(f"CRITICAL ERROR: Could not create log file in {dest_folder}: {e}")
-        return False
+        _process_logger().error(f"CRITICAL ERROR: Could not create log file in {dest_folder}: {e}")
+        return None
 
-    # Console Handler (Prints to screen)
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    return FolderLogger(_process_logger(), {'dest': str(dest_folder)})
 
-    return True
+def close_logger(logger: FolderLogger) -> None:
+    """
+    Tells the parent that the folder is done, so it closes the folder's log file.
+    """
+    logger.info("", extra={'close_log': True})
 
 def find_adobe_executable() -> str:
     """
@@ -100,9 +283,32 @@ def find_adobe_executable() -> str:
         
     return str(path)
 
-def generate_unique_path(dest_folder: Path, base_name: str, extension: str) -> Tuple[str, Path, int]:
+def list_existing_names(dest_folder: Path) -> Set[str]:
+    """
+    Snapshots the names already present in the destination folder.
+    Names are lowercased because Windows and macOS file systems are case-insensitive.
+    """
+    return {p.name.lower() for p in dest_folder.iterdir()}
+
+def find_raw_files(source_path: Path) -> List[Path]:
+    """
+    Lists the supported RAW files of a folder.
+    os.scandir reuses the file type from the directory read, so no stat() per entry is needed.
+    """
+    with os.scandir(source_path) as it:
+        return [
+            Path(entry.path) for entry in it
+            if entry.name.endswith(SUPPORTED_SUFFIXES) and entry.is_file()
+        ]
+
+def generate_unique_path(dest_folder: Path, base_name: str, extension: str,
+                         existing: Set[str]) -> Tuple[str, Path, int]:
     """
     Generates a unique filename to prevent overwriting existing files.
+    `existing` is the folder snapshot from list_existing_names(); the chosen name is added to it,
+    so later calls (including from parallel conversions) never pick the same one.
+    The name is claimed on disk with an empty placeholder created atomically (O_CREAT | O_EXCL),
+    so files that appeared after the snapshot are never overwritten either.
     Returns: (filename_string, full_path_object, duplicate_counter)
     """
     counter = 0
@@ -110,125 +316,599 @@ def generate_unique_path(dest_folder: Path, base_name: str, extension: str) -> T
         extension = '.' + extension
         
     filename = f"{base_name}{extension}"
-    file_path = dest_folder / filename
 
-    while file_path.exists():
-        counter += 1
-        filename = f"{base_name}_{counter}{extension}"
-        file_path = dest_folder / filename
+    with _name_lock:
+        while True:
+            if filename.lower() not in existing:
+                try:
+                    fd = os.open(str(dest_folder / filename), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+                    os.close(fd)
+                    existing.add(filename.lower())
+                    break
+                except FileExistsError:
+                    existing.add(filename.lower())
+            counter += 1
+            filename = f"{base_name}_{counter}{extension}"
     
-    return filename, file_path, counter
+    return filename, dest_folder / filename, counter
+
+def _remove_placeholder(path: Path) -> None:
+    """
+    Removes a name placeholder created by generate_unique_path(), if it is still there.
+    """
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        pass
+
+def _sendfile_copy(src: Path, dst: Path) -> None:
+    """
+    Copies file data inside the kernel with os.sendfile (Linux).
+    Falls back to a buffered copy if the kernel refuses file-to-file sendfile.
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        size = os.fstat(in_fd).st_size
+        offset = 0
+        try:
+            while offset < size:
+                sent = os.sendfile(out_fd, in_fd, offset, COPY_BLOCK_SIZE)
+                if sent == 0:
+                    break
+                offset += sent
+        except OSError:
+            if offset > 0:
+                raise
+            shutil.copyfileobj(fsrc, fdst, COPY_BLOCK_SIZE)
+
+class IoUringCopyEngine:
+    """
+    Copies files through a Linux io_uring. Each block is a READ linked to a WRITE of the same
+    buffer, and URING_QUEUE_DEPTH blocks are kept in flight, so a whole window of blocks
+    is submitted and reaped per syscall.
+    Every conversion thread has its own ring, so no SQPOLL: one kernel polling thread per ring
+    would busy-wait after each copy and take CPU from the converter processes.
+    """
+    ring = None
+
+    def __init__(self, depth: int = URING_QUEUE_DEPTH):
+        ring = liburing.Ring()
+        liburing.io_uring_queue_init(depth * 2, ring, 0)
+        self.ring = ring
+        self.cqe = liburing.Cqe()
+        self.buffers = [bytearray(COPY_BLOCK_SIZE) for _ in range(depth)]
+
+    def close(self) -> None:
+        if self.ring is not None and liburing is not None:
+            liburing.io_uring_queue_exit(self.ring)
+            self.ring = None
+
+    __del__ = close
+
+    def submit_copy(self, src_fd: int, dst_fd: int, size: int) -> None:
+        """
+        Copies `size` bytes from src_fd to dst_fd and waits until every block is written.
+        """
+        free = list(range(len(self.buffers)))
+        in_flight = {}  # buffer index -> (buffer, expected length)
+        offset = 0
+        pending = 0
+        error = None
+
+        while pending or (offset < size and error is None):
+            while free and offset < size and error is None:
+                idx = free.pop()
+                length = min(COPY_BLOCK_SIZE, size - offset)
+                # The last block gets its own buffer, as writes always send the whole buffer
+                buf = self.buffers[idx] if length == COPY_BLOCK_SIZE else bytearray(length)
+                in_flight[idx] = (buf, length)
+
+                sqe = liburing.io_uring_get_sqe(self.ring)
+                liburing.io_uring_prep_read(sqe, src_fd, buf, offset)
+                liburing.io_uring_sqe_set_flags(sqe, liburing.IOSQE_IO_LINK)
+                liburing.io_uring_sqe_set_data64(sqe, idx * 2)
+
+                sqe = liburing.io_uring_get_sqe(self.ring)
+                liburing.io_uring_prep_write(sqe, dst_fd, buf, offset)
+                liburing.io_uring_sqe_set_data64(sqe, idx * 2 + 1)
+
+                offset += length
+                pending += 2
+
+            liburing.io_uring_submit(self.ring)
+            liburing.io_uring_wait_cqe(self.ring, self.cqe)
+            cqe = self.cqe[0]
+            data = liburing.io_uring_cqe_get_data64(cqe)
+            idx = data // 2
+            pending -= 1
+
+            # Keep reaping after an error so the ring is clean for the next copy
+            try:
+                # Reading a failed result raises the matching OSError
+                res = cqe.res
+                if res != in_flight[idx][1]:
+                    raise OSError(f"Short io_uring transfer: {res} of {in_flight[idx][1]} bytes")
+            except OSError as e:
+                error = error or e
+            finally:
+                liburing.io_uring_cqe_seen(self.ring, cqe)
+            if data % 2:
+                free.append(idx)
+                del in_flight[idx]
+
+        if error is not None:
+            raise error
+
+def _get_uring_engine() -> Optional[IoUringCopyEngine]:
+    """
+    Returns this thread's io_uring engine, or None if io_uring can't be used here.
+    """
+    global _uring_available
+    if not _uring_available:
+        return None
+
+    engine = getattr(_uring_local, "engine", None)
+    if engine is None:
+        try:
+            engine = IoUringCopyEngine()
+        except OSError:
+            # Kernel without io_uring (or blocked by seccomp): stick to sendfile
+            _uring_available = False
+            return None
+        _uring_local.engine = engine
+    return engine
+
+def _uring_copy(src: Path, dst: Path, engine: IoUringCopyEngine) -> None:
+    """
+    Copies file data with the io_uring engine, falling back to sendfile if the ring fails.
+    """
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            engine.submit_copy(fsrc.fileno(), fdst.fileno(), os.fstat(fsrc.fileno()).st_size)
+    except OSError:
+        _sendfile_copy(src, dst)
 
-def process_single_folder(source_path_str: str, adobe_exe: str) -> None:
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copies a file using the OS zero-copy primitive, preserving metadata like shutil.copy2.
+    Windows: CopyFileW | macOS: fcopyfile | Linux: io_uring (if liburing is installed) or sendfile
+    """
+    system_os = platform.system()
+    if system_os == "Windows":
+        import ctypes
+        if not ctypes.windll.kernel32.CopyFileW(str(src), str(dst), False):
+            raise ctypes.WinError()
+    elif system_os == "Darwin" and sys.version_info >= (3, 8):
+        import posix
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            posix._fcopyfile(fsrc.fileno(), fdst.fileno(), posix._COPYFILE_DATA)
+    else:
+        engine = _get_uring_engine() if system_os == "Linux" else None
+        if engine is not None:
+            _uring_copy(src, dst, engine)
+        elif hasattr(os, "sendfile"):
+            _sendfile_copy(src, dst)
+        else:
+            shutil.copyfile(src, dst)
+
+    shutil.copystat(src, dst)
+
+def _read_through(path: Path) -> None:
+    """
+    Reads a file and discards the data, leaving it in the OS page cache.
+    """
+    buf = bytearray(COPY_BLOCK_SIZE)
+    try:
+        with open(path, 'rb', buffering=0) as f:
+            while f.readinto(buf):
+                pass
+    except OSError:
+        pass
+
+def prefetch_files(paths: List[Path]) -> None:
+    """
+    Starts reading files into the OS page cache before the converter opens them,
+    so rotational disks and network shares serve the converter from memory.
+    """
+    global _prefetch_executor
+    for path in paths:
+        if hasattr(os, "posix_fadvise"):
+            try:
+                fd = os.open(str(path), os.O_RDONLY)
+                try:
+                    os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+                finally:
+                    os.close(fd)
+            except OSError:
+                pass
+        else:
+            with _prefetch_lock:
+                if _prefetch_executor is None:
+                    _prefetch_executor = ThreadPoolExecutor(max_workers=1)
+            _prefetch_executor.submit(_read_through, path)
+
+def _run_converter(cmd: List[str], batch: List[Tuple[Path, str, Path, int, str]],
+                   outputs: List[Path], following: List[Path]) -> Tuple[int, bytes]:
+    """
+    Runs one converter command and returns its exit code and stderr, reading the PREFETCH_AHEAD inputs after the
+    one being converted into the page cache, continuing into the `following` inputs (of the next queued batch).
+    The converter works through a batch in order, so the last of its `outputs` that appeared
+    (failed files have none) tells which input it is on.
+    """
+    inputs = [raw_file for raw_file, *_ in batch] + following
+    current = 0
+    prefetched = 1  # The converter opens the first input itself
+    with subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE) as proc:
+        while True:
+            for i in range(len(outputs) - 1, current - 1, -1):
+                if outputs[i].exists():
+                    current = i + 1
+                    break
+            ahead = min(len(inputs), current + 1 + PREFETCH_AHEAD)
+            prefetch_files(inputs[prefetched:ahead])
+            prefetched = max(prefetched, ahead)
+
+            try:
+                _, stderr = proc.communicate(timeout=PREFETCH_POLL_INTERVAL if prefetched < len(inputs) else None)
+                return proc.returncode, stderr
+            except subprocess.TimeoutExpired:
+                pass
+
+def _copy_original(raw_file: Path, dest_path: Path, details: str,
+                   existing: Set[str], logger: FolderLogger) -> Tuple[str, str, str]:
+    """
+    Fallback for a failed conversion: copies the original RAW file to the output folder.
+    Returns: (status, output_name, message) where status is 'copied' or 'error';
+    output_name is empty on error, since nothing was written.
+    """
+    logger.debug("  -> Attempting to COPY original file to output folder...")
+
+    copy_dest = None
+    try:
+        # Generate unique name for the copy (in case the raw file already exists there)
+        copy_name, copy_dest, copy_idx = generate_unique_path(dest_path, raw_file.stem, raw_file.suffix, existing)
+        
+        # Copies over the empty placeholder that reserved the name
+        _fast_copy(raw_file, copy_dest)
+        
+        if copy_idx > 0:
+            logger.debug(f"  -> Original file copied with rename: {copy_name}")
+        else:
+            logger.debug(f"  -> Original file copied successfully.")
+        
+        return 'copied', copy_name, details
+        
+    except Exception as e_copy:
+        logger.error(f"  -> CRITICAL: Failed to convert AND failed to copy {raw_file.name}")
+        logger.error(f"     Copy Error: {e_copy}")
+        if copy_dest is not None:
+            # Don't leave an empty or partial copy behind
+            try:
+                copy_dest.unlink()
+            except OSError:
+                pass
+        return 'error', "", str(e_copy)
+
+def _convert_batch(batch: List[Tuple[Path, str, Path, int, str]], dest_path: Path, base_cmd: List[str],
+                   existing: Set[str], logger: FolderLogger,
+                   stop: threading.Event, following: List[Path]) -> List[Tuple[str, str, str]]:
+    """
+    Converts a batch of RAW files with a single Adobe DNG Converter run, copying the original
+    of every file that failed. Batch items are (raw_file, dng_name, dng_path, collision_idx, position);
+    `base_cmd` is the folder's invariant command prefix (executable and options).
+    Files left unconverted by an interrupted run (the converter was killed by SIGINT/SIGTERM,
+    or `stop` is set) are reported as errors instead of copied.
+    The `following` inputs (of the next queued batch) are read ahead once this batch's own run out.
+    A single file is converted with -o; larger batches let Adobe name outputs after the inputs.
+    Renamed files can't get their name that way, so their batches convert into a temporary
+    folder and each output is then moved to its reserved name.
+    Returns one (status, output_name, message) per file: 'converted', 'copied' or 'error'.
+    """
+    for raw_file, dng_name, _, idx, position in batch:
+        logger.debug(f"[{position}] Processing: {raw_file.name}")
+        
+        if idx > 0:
+            logger.warning(f"  -> Name collision detected. Saving as: {dng_name}")
+
+    staged = len(batch) > 1 and batch[0][3] > 0
+    if not staged:
+        # Remove the name placeholders, so Adobe doesn't refuse to overwrite or rename its output.
+        # The names stay reserved in `existing`, so no other conversion can take them.
+        for _, _, dng_path, _, _ in batch:
+            _remove_placeholder(dng_path)
+
+    stage_path = None
+    try:
+        # Construct Command
+        if len(batch) == 1:
+            cmd = base_cmd + ["-d", str(dest_path), "-o", batch[0][1], str(batch[0][0])]
+            outputs = [batch[0][2]]
+        elif staged:
+            # Same filesystem as the reserved names, so moving the outputs there is a rename
+            stage_path = Path(tempfile.mkdtemp(prefix=".batch-", dir=str(dest_path)))
+            cmd = base_cmd + ["-d", str(stage_path)] + [str(raw_file) for raw_file, *_ in batch]
+            outputs = [stage_path / f"{raw_file.stem}.dng" for raw_file, *_ in batch]
+        else:
+            cmd = base_cmd + ["-d", str(dest_path)] + [str(raw_file) for raw_file, *_ in batch]
+            outputs = [dng_path for _, _, dng_path, _, _ in batch]
+
+        # Execute Adobe DNG Converter
+        # Only stderr is ever read, and it stays as bytes: it is only decoded if a conversion failed
+        returncode, stderr = _run_converter(cmd, batch, outputs, following)
+    except Exception as e:
+        for raw_file, *_ in batch:
+            logger.error(f"Fatal Python Error processing {raw_file.name}: {e}")
+        return [('error', "", str(e)) for _ in batch]
+    finally:
+        if stage_path is not None:
+            # Move each output over the placeholder of its reserved name; a missing output
+            # releases the placeholder instead
+            for (_, _, dng_path, _, _), output in zip(batch, outputs):
+                try:
+                    os.replace(str(output), str(dng_path))
+                except OSError:
+                    _remove_placeholder(dng_path)
+            shutil.rmtree(str(stage_path), ignore_errors=True)
+
+    # Ctrl+C reaches the converter too: what it didn't finish wasn't a failed conversion
+    interrupted = returncode in (-signal.SIGINT, -signal.SIGTERM) or stop.is_set()
+
+    details = None
+    results = []
+    for raw_file, dng_name, dng_path, _, _ in batch:
+        # Validation: Check if DNG was actually created
+        if dng_path.exists():
+            results.append(('converted', dng_name, ""))
+            continue
+
+        if interrupted:
+            logger.warning(f"  -> Conversion INTERRUPTED for {raw_file.name}.")
+            results.append(('error', "", "Interrupted"))
+            continue
+
+        # --- FAILURE HANDLING: FALLBACK TO COPY ---
+        logger.warning(f"  -> Conversion FAILED for {raw_file.name}.")
+
+        if details is None:
+            # Filter out irrelevant GPU warnings from logs
+            details = '; '.join(line.decode('utf-8', 'replace').strip() for line in GPU_RE.findall(stderr))
+        if details:
+            logger.warning(f"     Adobe Error Details: {details}")
+
+        results.append(_copy_original(raw_file, dest_path, details, existing, logger))
+
+    return results
+
+def plan_batches(items: List[Tuple[Path, str, Path, int, str]], batch_size: int,
+                 jobs: int) -> List[List[Tuple[Path, str, Path, int, str]]]:
+    """
+    Groups files into Adobe DNG Converter runs of at most `batch_size` files.
+    Files whose output is plain <stem>.dng and renamed files go to separate runs
+    (see _convert_batch), and no run gets two inputs with the same stem.
+    Batches are made smaller when needed so all `jobs` workers get something to do,
+    and so the input paths fit in MAX_INPUT_CHARS of command line.
+    A `batch_size` of 0 means one run per folder, limited only by MAX_BATCH_SIZE and the command line.
+    """
+    plain = [item for item in items if item[3] == 0]
+    renamed = [item for item in items if item[3] > 0]
+
+    if batch_size == 0:
+        size = MAX_BATCH_SIZE
+    else:
+        size = max(1, min(batch_size, -(-len(items) // jobs)))
+    batches = []
+    for group in (plain, renamed):
+        batch, chars, stems = [], 0, set()
+        for item in group:
+            length = len(str(item[0])) + 3  # Quotes and separator
+            stem = item[0].stem.lower()
+            if batch and (len(batch) == size or chars + length > MAX_INPUT_CHARS or stem in stems):
+                batches.append(batch)
+                batch, chars, stems = [], 0, set()
+            batch.append(item)
+            chars += length
+            stems.add(stem)
+        if batch:
+            batches.append(batch)
+
+    return batches
+
+def write_results(dest_folder: Path, results: List[Tuple[str, str, str, str]],
+                  logger: FolderLogger) -> None:
+    """
+    Writes the per-file outcomes of a folder to a CSV file INSIDE the destination folder.
+    """
+    try:
+        with open(dest_folder / RESULTS_FILENAME, 'w', encoding='utf-8', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(("source_file", "status", "output_file", "message"))
+            writer.writerows(sorted(results))
+        logger.info(f"Per-file results saved to: {RESULTS_FILENAME}")
+    except Exception as e:
+        logger.error(f"Could not write results file {RESULTS_FILENAME}: {e}")
+
+def process_single_folder(source_path_str: str, adobe_exe: str, jobs: int = DEFAULT_JOBS,
+                          batch_size: int = DEFAULT_BATCH_SIZE) -> Optional[Dict[str, int]]:
     """
     Process a single directory: Convert RAWs to DNG or copy original on failure.
+    Up to `jobs` Adobe runs of up to `batch_size` files each run in parallel
+    (0: one run for the whole folder).
+    Returns the folder stats, or None if the folder was skipped.
     """
     source_path = Path(source_path_str).resolve()
     
     if not source_path.exists() or not source_path.is_dir():
-        print(f"SKIPPING: Invalid directory path: {source_path}")
-        return
+        _process_logger().warning(f"SKIPPING: Invalid directory path: {source_path}")
+        return None
 
     # 1. Create Output Directory
     dest_path = source_path / OUTPUT_DIR_NAME
     try:
         dest_path.mkdir(exist_ok=True)
+        # Snapshot existing names once instead of probing the disk for every candidate name
+        existing = list_existing_names(dest_path)
     except Exception as e:
-        print(f"CRITICAL ERROR: Could not create output directory at {source_path}. Error: {e}")
-        return
+        _process_logger().error(f"CRITICAL ERROR: Could not create output directory at {source_path}. Error: {e}")
+        return None
 
     # 2. Setup Logging inside the output directory
-    if not setup_logger(dest_path):
-        return
+    logger = setup_logger(dest_path)
+    if logger is None:
+        return None
+
+    try:
+        logger.info(f"Started processing. Log saved to: {dest_path}")
 
-    logging.info(f"Started processing. Log saved to: {dest_path}")
+        # Folder invariants, computed once instead of for every Adobe run
+        dest_path_str = str(dest_path)
+        base_cmd = [adobe_exe, *ADOBE_ARGS]
+        command_prefix = f"{os.path.basename(adobe_exe)} {' '.join(ADOBE_ARGS)} -d \"{dest_path_str}\""
     
-    # --- LOG THE COMMAND TEMPLATE (Requested Feature) ---
-    command_template = f"{os.path.basename(adobe_exe)} {' '.join(ADOBE_ARGS)} -d \"{dest_path}\" -o [OUTPUT_NAME] [INPUT_FILE]"
-    logging.info(f"Batch Conversion Command Template: {command_template}")
-    # ----------------------------------------------------
+        # --- LOG THE COMMAND TEMPLATE (Requested Feature) ---
+        command_template = f"{command_prefix} -o [OUTPUT_NAME] [INPUT_FILE]"
+        logger.info(f"Batch Conversion Command Template: {command_template}")
+        if batch_size != 1:
+            multi_template = f"{command_prefix} [INPUT_FILE_1] [INPUT_FILE_2] ..."
+            logger.info(f"Multi-file Command Template (up to {batch_size or MAX_BATCH_SIZE} files): {multi_template}")
+        # ----------------------------------------------------
+
+        # 3. Find Files
+        raw_files = find_raw_files(source_path)
+
+        if not raw_files:
+            logger.warning("No supported RAW files found in this directory.")
+            return {'converted': 0, 'copied': 0, 'errors': 0}
+
+        raw_count = len(raw_files)
+        logger.info(f"Found {raw_count} RAW files to process.")
+
+        stats = {'converted': 0, 'copied': 0, 'errors': 0}
+        # Per-file outcome as (source_file, status, output_name, message), written to a CSV at the end,
+        # so the hot path only logs failures
+        results: List[Tuple[str, str, str, str]] = []
+
+        items = []
+        futures = {}
+        stop = threading.Event()
+        try:
+            # 4. Reserve output names up front, then group files into Adobe runs
+            for i, raw_file in enumerate(raw_files, 1):
+                dng_name, dng_path, idx = generate_unique_path(dest_path, raw_file.stem, ".dng", existing)
+                items.append((raw_file, dng_name, dng_path, idx, f"{i}/{raw_count}"))
 
-    # 3. Find Files
-    raw_files = [
-        f for f in source_path.iterdir() 
-        if f.is_file() and f.suffix.lower() in SUPPORTED_EXTENSIONS
-    ]
+            batches = plan_batches(items, batch_size, jobs)
 
-    if not raw_files:
-        logging.warning("No supported RAW files found in this directory.")
-        return
+            # Each batch runs in its own Adobe process, so threads are enough to keep all cores busy
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                try:
+                    # Batches start in order, so batch k + 1 is the next one queued when batch k starts
+                    for k, batch in enumerate(batches):
+                        following = [item[0] for item in batches[k + 1][:PREFETCH_AHEAD]] if k + 1 < len(batches) else []
+                        future = executor.submit(_convert_batch, batch, dest_path, base_cmd, existing,
+                                                 logger, stop, following)
+                        futures[future] = batch
+                    for future in as_completed(futures):
+                        for item, (status, output_name, message) in zip(futures[future], future.result()):
+                            stats['errors' if status == 'error' else status] += 1
+                            results.append((item[0].name, status, output_name, message))
+                except BaseException:
+                    # Interrupted: batches still queued must never start, and running ones
+                    # must not copy the originals of the files they didn't get to
+                    stop.set()
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            # Release the placeholders of batches that never ran, so an interrupted run
+            # leaves no empty .dng files that look like converted output
+            started = {item[2] for future, batch in futures.items() if not future.cancelled() for item in batch}
+            for _, _, dng_path, _, _ in items:
+                if dng_path not in started:
+                    _remove_placeholder(dng_path)
+
+        write_results(dest_path, results, logger)
+
+        logger.info("-" * 40)
+        logger.info(f"SUMMARY: {stats['converted']} Converted (DNG) | {stats['copied']} Copied (Originals) | {stats['errors']} Total Failures")
+        logger.info("=" * 40)
+
+        return stats
+    finally:
+        # Always let the log file be closed, even if the folder failed halfway
+        close_logger(logger)
+
+def _interrupt_worker(signum, frame) -> None:
+    """
+    Turns the first Ctrl+C (SIGINT) or pool terminate (SIGTERM) into KeyboardInterrupt and ignores the
+    rest, so a second signal can't cut short the cleanup of the folder being processed.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    raise KeyboardInterrupt
 
-    logging.info(f"Found {len(raw_files)} RAW files to process.")
+def _init_worker(adobe_exe: str, log_queue: multiprocessing.Queue) -> None:
+    """
+    Pool initializer: stores the executable found by the parent, so workers never search for it again,
+    and sends all log records to the parent's listener.
+    """
+    global _worker_adobe_exe
+    _worker_adobe_exe = adobe_exe
 
-    stats = {'converted': 0, 'copied': 0, 'errors': 0}
+    root = logging.getLogger()
+    root.handlers.clear()
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(logging.INFO)
 
-    for i, raw_file in enumerate(raw_files, 1):
-        # Prepare unique DNG output name
-        dng_name, dng_path, idx = generate_unique_path(dest_path, raw_file.stem, ".dng")
-        
-        logging.info(f"[{i}/{len(raw_files)}] Processing: {raw_file.name}")
-        
-        if idx > 0:
-            logging.warning(f"  -> Name collision detected. Saving as: {dng_name}")
+    signal.signal(signal.SIGINT, _interrupt_worker)
+    signal.signal(signal.SIGTERM, _interrupt_worker)
 
-        # Construct Command
-        cmd = [
-            adobe_exe,
-            *ADOBE_ARGS,
-            "-d", str(dest_path),
-            "-o", dng_name,
-            str(raw_file)
-        ]
-
-        try:
-            # Execute Adobe DNG Converter
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            # Validation: Check if DNG was actually created
-            if dng_path.exists():
-                stats['converted'] += 1
-            else:
-                # --- FAILURE HANDLING: FALLBACK TO COPY ---
-                error_msg = result.stderr
-                logging.warning(f"  -> Conversion FAILED for {raw_file.name}.")
-                
-                # Filter out irrelevant GPU warnings from logs
-                clean_errors = [line for line in error_msg.split('\n') if "GPU" not in line and line.strip()]
-                if clean_errors:
-                    logging.warning(f"     Adobe Error Details: {'; '.join(clean_errors)}")
-                
-                logging.info("  -> Attempting to COPY original file to output folder...")
+def _process_folder_task(task: Tuple[str, str, int, int]) -> Optional[Dict[str, int]]:
+    """
+    Pool worker entry point: unpacks (index, folder, jobs, batch_size) and processes the folder.
+    """
+    i, folder, jobs, batch_size = task
+    _process_logger().info(f">>> Processing Folder {i}: {folder}")
+    try:
+        return process_single_folder(folder, _worker_adobe_exe, jobs, batch_size)
+    except Exception as e:
+        # Never let one broken folder take down the whole pool
+        _process_logger().error(f"CRITICAL ERROR: Unexpected failure processing {folder}: {e}")
+        return None
 
-                try:
-                    # Generate unique name for the copy (in case the raw file already exists there)
-                    copy_name, copy_dest, copy_idx = generate_unique_path(dest_path, raw_file.stem, raw_file.suffix)
-                    
-                    shutil.copy2(raw_file, copy_dest)
-                    
-                    if copy_idx > 0:
-                        logging.info(f"  -> Original file copied with rename: {copy_name}")
-                    else:
-                        logging.info(f"  -> Original file copied successfully.")
-                    
-                    stats['copied'] += 1
-                    
-                except Exception as e_copy:
-                    logging.error(f"  -> CRITICAL: Failed to convert AND failed to copy {raw_file.name}")
-                    logging.error(f"     Copy Error: {e_copy}")
-                    stats['errors'] += 1
-
-        except Exception as e:
-            logging.error(f"Fatal Python Error processing {raw_file.name}: {e}")
-            stats['errors'] += 1
-
-    logging.info("-" * 40)
-    logging.info(f"SUMMARY: {stats['converted']} Converted (DNG) | {stats['copied']} Copied (Originals) | {stats['errors']} Total Failures")
-    logging.info("=" * 40)
+def read_folder_list(list_path: Path) -> Iterator[str]:
+    """
+    Yields the folders of the list file one by one, skipping blank lines,
+    so work starts right away and memory stays flat for huge lists.
+    """
+    with open(list_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            folder = line.strip()
+            if folder:
+                yield folder
 
 def main():
     parser = argparse.ArgumentParser(description="Batch converts RAW files to DNG using Adobe DNG Converter.")
     parser.add_argument("list_file", help="Path to the .txt file containing the list of directories to process.")
+    parser.add_argument("-j", "--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"Number of converter runs in parallel per folder, each on up to --batch-size files "
+                             f"(default: {DEFAULT_JOBS}).")
+    parser.add_argument("-f", "--folder-jobs", type=int, default=1,
+                        help="Number of folders processed in parallel (default: 1). "
+                             "Each folder runs up to --jobs conversions of its own.")
+    parser.add_argument("-b", "--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help=f"Maximum number of files per Adobe DNG Converter run (default: {DEFAULT_BATCH_SIZE}). "
+                             f"Use 1 to convert every file separately, or 0 for one run per folder (up to {MAX_BATCH_SIZE} files), "
+                             f"which ignores --jobs for folders that fit in a single run.")
+    parser.add_argument("--count", action="store_true",
+                        help="Count the folders before starting, to show 'Folder i/N' progress.")
     args = parser.parse_args()
+
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1.")
+    if args.folder_jobs < 1:
+        parser.error("--folder-jobs must be at least 1.")
+    if not 0 <= args.batch_size <= MAX_BATCH_SIZE:
+        parser.error(f"--batch-size must be between 0 and {MAX_BATCH_SIZE}.")
     
     list_path = Path(args.list_file)
     
@@ -240,17 +920,49 @@ def main():
     
     print(f"Reading directory list from: {list_path.name}...\n")
 
-    with open(list_path, 'r', encoding='utf-8') as f:
-        folders = [line.strip() for line in f.readlines() if line.strip()]
+    total = None
+    if args.count:
+        total = sum(1 for _ in read_folder_list(list_path))
+        print(f"Total folders to process: {total}")
+    # Flush before forking so the banner is not duplicated by the workers
+    print("-" * 30, flush=True)
+
+    # Lazily read the list: the pool pulls folders as workers become free
+    tasks = (
+        (f"{i}/{total}" if total is not None else str(i), folder, args.jobs, args.batch_size)
+        for i, folder in enumerate(read_folder_list(list_path), 1)
+    )
+    totals = {'converted': 0, 'copied': 0, 'errors': 0}
+    skipped = 0
 
-    print(f"Total folders to process: {len(folders)}")
-    print("-" * 30)
+    # Workers process whole folders; the parent aggregates their stats and writes all logs
+    log_queue = multiprocessing.Queue(-1)
 
-    for i, folder in enumerate(folders, 1):
-        print(f"\n>>> Processing Folder {i}/{len(folders)}: {folder}")
-        process_single_folder(folder, adobe_exe)
+    with multiprocessing.Pool(processes=args.folder_jobs, initializer=_init_worker,
+                              initargs=(adobe_exe, log_queue)) as pool:
+        # Started once the workers are forked, so they don't fork while its thread runs
+        listener = start_log_listener(log_queue)
+        try:
+            for stats in pool.imap_unordered(_process_folder_task, tasks):
+                if stats is None:
+                    skipped += 1
+                    continue
+                for key in totals:
+                    totals[key] += stats[key]
+
+            # Let workers exit normally, so their queued log records are flushed
+            pool.close()
+            pool.join()
+        finally:
+            # On Ctrl+C, wait for the workers' cleanup, then write every record still queued
+            pool.terminate()
+            listener.stop()
+            for handler in listener.handlers:
+                handler.close()
 
     print("\nBatch processing complete.")
+    print(f"TOTAL: {totals['converted']} Converted (DNG) | {totals['copied']} Copied (Originals) | "
+          f"{totals['errors']} Total Failures | {skipped} Folders Skipped")
 
 if __name__ == "__main__":
     main()